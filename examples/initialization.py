@@ -6,49 +6,26 @@ This script serves as the entry point for the Identitwin monitoring system.
 """
 
 import argparse
-import sys
-import time
 import math
+import sys
 import warnings
 import os
-import traceback
 import platform
-from datetime import datetime
-import numpy as np
-import matplotlib
-import importlib  # Add importlib to dynamically load modules
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-# Suppress warnings related to hardware detection
-warnings.filterwarnings("ignore", category=RuntimeWarning)
-warnings.filterwarnings("ignore", message=".*chip_id.*")
-warnings.filterwarnings("ignore", message=".*Adafruit-PlatformDetect.*")
-
 # Check if we're on a Raspberry Pi
 IS_RASPBERRY_PI = platform.system() == "Linux"
 
-# Ensure TkAgg backend is used, falling back to QtAgg if necessary.
-try:
-    matplotlib.use('TkAgg')
-except ImportError:
-    print("Warning: TkAgg backend not found, trying QtAgg...")
-    try:
-        matplotlib.use('QtAgg')
-    except ImportError:
-        print("Warning: QtAgg backend not found. Plotting might not work interactively.")
-
+# Event plots are rendered off-screen (identitwin.event_monitoring selects the
+# Agg backend) and the live dashboard is served by Dash, so no interactive
+# matplotlib backend is needed here.
 warnings.filterwarnings("ignore", message="FigureCanvasAgg is non-interactive, and thus cannot be shown")
 
-# Import from the identitwin library
-from identitwin import configurator
-from identitwin.system_monitoring import MonitoringSystem
-from identitwin import calibration
-from identitwin import report_generator
-from identitwin import state # <--- IMPORT STATE MODULE
-
 # Default values for sampling rates and thresholds.
 ACCEL_SAMPLING_RATE = 100.0  # Hz
 LVDT_SAMPLING_RATE = 20.0  # Hz
@@ -72,14 +49,57 @@ MIN_EVENT_DURATION = 2.0  # seconds
 STATUS_PIN = 17
 ACTIVITY_PIN = 18
 
-# Define default sensor and plot settings.
-enable_lvdt = True
-enable_accel = True
 
-enable_plots = True
-enable_plot_displacement = True
-enable_accel_plots = True
-enable_fft_plots = True
+@dataclass(frozen=True)
+class RuntimeSettings:
+    """Sensor, plot and sampling settings for one run.
+
+    Defaults are the script defaults above; `apply_cli_args` returns a copy
+    with the command-line overrides applied.
+
+    Attributes:
+        enable_lvdt (bool): Enable LVDT sensors.
+        enable_accel (bool): Enable accelerometer sensors.
+        enable_plots (bool): Enable the plotting dashboard.
+        enable_plot_displacement (bool): Enable LVDT displacement plots.
+        enable_accel_plots (bool): Enable acceleration plots.
+        enable_fft_plots (bool): Enable FFT plots.
+        accel_sampling_rate (float): Accelerometer sampling rate (Hz).
+        lvdt_sampling_rate (float): LVDT sampling rate (Hz).
+        plot_refresh_rate (float): Plot refresh rate (Hz).
+    """
+    enable_lvdt: bool = True
+    enable_accel: bool = True
+    enable_plots: bool = True
+    enable_plot_displacement: bool = True
+    enable_accel_plots: bool = True
+    enable_fft_plots: bool = True
+    accel_sampling_rate: float = ACCEL_SAMPLING_RATE
+    lvdt_sampling_rate: float = LVDT_SAMPLING_RATE
+    plot_refresh_rate: float = PLOT_REFRESH_RATE
+
+
+# Command-line argument -> RuntimeSettings field overridden by it.
+CLI_TOGGLES = (
+    ("lvdt", "enable_lvdt"),
+    ("accel", "enable_accel"),
+    ("plot_displacement", "enable_plot_displacement"),
+    ("accel_plots", "enable_accel_plots"),
+    ("fft_plots", "enable_fft_plots"),
+)
+CLI_RATES = (
+    ("accel_rate", "accel_sampling_rate"),
+    ("lvdt_rate", "lvdt_sampling_rate"),
+    ("plot_rate", "plot_refresh_rate"),
+)
+
+# (enable_lvdt, enable_accel) -> operation mode name.
+OPERATION_MODE_NAMES = {
+    (True, True): "Combined Mode (LVDT + Accelerometers)",
+    (True, False): "LVDT-Only Mode",
+    (False, True): "Accelerometer-Only Mode",
+    (False, False): "No Sensors Mode (Invalid)",
+}
 
 
 def print_banner():
@@ -98,12 +118,56 @@ Instituto Tecnologico de Costa Rica, 2025
 ===============================================================================
 """
     print(banner)
-    time.sleep(5)
 
 
+def positive_float(text):
+    """Argparse type for rates: a finite float strictly greater than zero.
+
+    Args:
+        text (str): The command-line value.
+
+    Returns:
+        float: The parsed value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a finite positive number.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}")
+    if not math.isfinite(value):
+        raise argparse.ArgumentTypeError(f"must be a finite number, got {text}")
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+
+def add_toggle(group, name, description):
+    """Add a --<name>/--no-<name> flag pair sharing one destination.
+
+    The destination defaults to None so `apply_cli_args` can tell whether
+    the flag was given at all.
+
+    Args:
+        group: Argument group to add the flags to.
+        name (str): Flag name without the leading dashes.
+        description (str): What the flag turns on or off.
+    """
+    dest = name.replace('-', '_')
+    group.add_argument(f'--{name}', dest=dest, action='store_true', default=None,
+                       help=f'Enable {description}')
+    group.add_argument(f'--no-{name}', dest=dest, action='store_false',
+                       help=f'Disable {description}')
+
+
+@lru_cache(maxsize=1)
 def parse_arguments():
     """Parse command-line arguments to configure the monitoring system.
 
+    The parser is built and `sys.argv` parsed only on the first call; later
+    calls return the same namespace.
+
     Args:
         None
 
@@ -114,33 +178,30 @@ def parse_arguments():
 
     # Sensor configuration
     sensor_group = parser.add_argument_group('Sensor Configuration')
-    sensor_group.add_argument('--lvdt', action='store_true', help='Enable LVDT measurements')
-    sensor_group.add_argument('--no-lvdt', action='store_true', help='Disable LVDT measurements')
-    sensor_group.add_argument('--accel', action='store_true', help='Enable accelerometer measurements')
-    sensor_group.add_argument('--no-accel', action='store_true', help='Disable accelerometer measurements')
+    add_toggle(sensor_group, 'lvdt', 'LVDT measurements')
+    add_toggle(sensor_group, 'accel', 'accelerometer measurements')
 
     # Visualization configuration
     visual_group = parser.add_argument_group('Visualization Configuration')
-    visual_group.add_argument('--plot-displacement', action='store_true', help='Enable LVDT displacement plots')
-    visual_group.add_argument('--no-plot-displacement', action='store_true', help='Disable LVDT displacement plots')
-    visual_group.add_argument('--accel-plots', action='store_true', help='Enable acceleration plots')
-    visual_group.add_argument('--no-accel-plots', action='store_true', help='Disable acceleration plots')
-    visual_group.add_argument('--fft-plots', action='store_true', help='Enable FFT plots')
-    visual_group.add_argument('--no-fft-plots', action='store_true', help='Disable FFT plots')
+    add_toggle(visual_group, 'plot-displacement', 'LVDT displacement plots')
+    add_toggle(visual_group, 'accel-plots', 'acceleration plots')
+    add_toggle(visual_group, 'fft-plots', 'FFT plots')
 
     # Sampling rate configuration
     rate_group = parser.add_argument_group('Sampling Rate Configuration')
-    rate_group.add_argument('--accel-rate', type=float,
+    rate_group.add_argument('--accel-rate', type=positive_float,
                             help=f'Accelerometer sampling rate in Hz (default: {ACCEL_SAMPLING_RATE} Hz)')
-    rate_group.add_argument('--lvdt-rate', type=float,
+    rate_group.add_argument('--lvdt-rate', type=positive_float,
                             help=f'LVDT sampling rate in Hz (default: {LVDT_SAMPLING_RATE} Hz)')
-    rate_group.add_argument('--plot-rate', type=float,
+    rate_group.add_argument('--plot-rate', type=positive_float,
                             help=f'Plot refresh rate in Hz (default: {PLOT_REFRESH_RATE} Hz)')
 
     # System configuration
     system_group = parser.add_argument_group('System Configuration')
     system_group.add_argument('--output-dir', type=str, help='Custom output directory')
     system_group.add_argument('--config', type=str, help='Path to configuration file')
+    system_group.add_argument('--recalibrate', action='store_true',
+                              help='Recalibrate accelerometers even if cached offsets are available')
 
     # Add simulation mode
     parser.add_argument('--simulation', action='store_true', help='Run in simulation mode (simulated sensors)')
@@ -148,96 +209,62 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def apply_cli_args(args):
+def apply_cli_args(args, settings=RuntimeSettings()):
     """Apply command-line arguments to override the default configuration.
 
     Args:
         args: Parsed command-line arguments.
+        settings (RuntimeSettings, optional): Settings to override. Defaults
+            to the script defaults.
 
     Returns:
-        None
+        RuntimeSettings: A new settings object with the overrides applied.
     """
-    global enable_lvdt, enable_accel, enable_plot_displacement, enable_accel_plots, enable_fft_plots
-    global ACCEL_SAMPLING_RATE, LVDT_SAMPLING_RATE, PLOT_REFRESH_RATE
-
-    # Override sensor settings
-    if args.lvdt:
-        enable_lvdt = True
-    if args.no_lvdt:
-        enable_lvdt = False
-    if args.accel:
-        enable_accel = True
-    if args.no_accel:
-        enable_accel = False
-
-    # Override visualization settings
-    if args.plot_displacement:
-        enable_plot_displacement = True
-    if args.no_plot_displacement:
-        enable_plot_displacement = False
-    if args.accel_plots:
-        enable_accel_plots = True
-    if args.no_accel_plots:
-        enable_accel_plots = False
-    if args.fft_plots:
-        enable_fft_plots = True
-    if args.no_fft_plots:
-        enable_fft_plots = False
+    overrides = {}
+
+    # Override on/off settings (None means the flag was not given)
+    for arg_name, field in CLI_TOGGLES:
+        value = getattr(args, arg_name)
+        if value is not None:
+            overrides[field] = value
 
     # Ensure plot settings are consistent with sensor availability
-    if not enable_lvdt:
-        enable_plot_displacement = False
-    if not enable_accel:
-        enable_accel_plots = False
-        enable_fft_plots = False
-
-    # Override sampling rates with validation
-    if args.accel_rate is not None:
-        if args.accel_rate > 0:
-            ACCEL_SAMPLING_RATE = args.accel_rate
-        else:
-            print(f"Warning: Invalid accelerometer sampling rate ({args.accel_rate}). Using default: {ACCEL_SAMPLING_RATE} Hz")
-
-    if args.lvdt_rate is not None:
-        if args.lvdt_rate > 0:
-            LVDT_SAMPLING_RATE = args.lvdt_rate
-        else:
-            print(f"Warning: Invalid LVDT sampling rate ({args.lvdt_rate}). Using default: {LVDT_SAMPLING_RATE} Hz")
-
-    if args.plot_rate is not None:
-        if args.plot_rate > 0:
-            PLOT_REFRESH_RATE = args.plot_rate
-        else:
-            print(f"Warning: Invalid plot refresh rate ({args.plot_rate}). Using default: {PLOT_REFRESH_RATE} Hz")
-
-
-def get_operation_mode_name():
+    if not overrides.get("enable_lvdt", settings.enable_lvdt):
+        overrides["enable_plot_displacement"] = False
+    if not overrides.get("enable_accel", settings.enable_accel):
+        overrides["enable_accel_plots"] = False
+        overrides["enable_fft_plots"] = False
+
+    # Override sampling rates (already validated by parse_arguments)
+    for arg_name, field in CLI_RATES:
+        value = getattr(args, arg_name)
+        if value is not None:
+            overrides[field] = value
+
+    return replace(settings, **overrides)
+
+
+def get_operation_mode_name(settings):
     """Return a descriptive name for the current operation mode.
 
     Args:
-        None
+        settings (RuntimeSettings): The run settings.
 
     Returns:
         str: Operation mode name.
     """
-    if enable_lvdt and enable_accel:
-        return "Combined Mode (LVDT + Accelerometers)"
-    elif enable_lvdt:
-        return "LVDT-Only Mode"
-    elif enable_accel:
-        return "Accelerometer-Only Mode"
-    else:
-        return "No Sensors Mode (Invalid)"
+    return OPERATION_MODE_NAMES[(settings.enable_lvdt, settings.enable_accel)]
 
 
 def main():
     """Main function to initialize and run the monitoring system."""
+    # Parse first so --help and usage errors exit before anything is printed
+    args = parse_arguments()
     print_banner()
 
-    args = parse_arguments()
-    apply_cli_args(args)
+    settings = apply_cli_args(args)
 
-    if not enable_lvdt and not enable_accel:
+    if not settings.enable_lvdt and not settings.enable_accel:
         print("At least one sensor type (LVDT or accelerometer) must be enabled.")
         sys.exit(1)
 
@@ -245,21 +272,31 @@ def main():
     simulation_mode = args.simulation or not IS_RASPBERRY_PI
     if not IS_RASPBERRY_PI and not args.simulation:
         print("Non-Raspberry Pi platform detected. Automatically enabling simulation mode.")
-    
-    # Dynamically load the appropriate configuration module
-    config_module_name = "identitwin.simulator" if simulation_mode else "identitwin.configurator"
-    config_module = importlib.import_module(config_module_name)
-    SystemConfig = config_module.SimulatorConfig if simulation_mode else config_module.SystemConfig
+    if simulation_mode:
+        # Tell identitwin.configurator not to import and probe the hardware libraries
+        os.environ["IDENTITWIN_SIMULATION"] = "1"
+
+    # Imported after argument parsing so --help and invalid invocations
+    # return without loading the monitoring stack
+    from identitwin import report_generator
+    from identitwin.system_monitoring import MonitoringSystem
+
+    # Pick the configuration class for the selected mode
+    if simulation_mode:
+        from identitwin.simulator import SimulatorConfig as SystemConfig
+    else:
+        from identitwin.configurator import SystemConfig, describe_platform
+        describe_platform()
 
     print("\n======================== Identitwin Monitoring System =========================\n")
     print(f"Operation Mode: {'Simulation' if simulation_mode else 'Hardware'}")
 
     config = SystemConfig(
-        enable_lvdt=enable_lvdt,
-        enable_accel=enable_accel,
-        sampling_rate_acceleration=ACCEL_SAMPLING_RATE,
-        sampling_rate_lvdt=LVDT_SAMPLING_RATE,
-        plot_refresh_rate=PLOT_REFRESH_RATE,
+        enable_lvdt=settings.enable_lvdt,
+        enable_accel=settings.enable_accel,
+        sampling_rate_acceleration=settings.accel_sampling_rate,
+        sampling_rate_lvdt=settings.lvdt_sampling_rate,
+        plot_refresh_rate=settings.plot_refresh_rate,
         output_dir=args.output_dir,
         num_lvdts=NUM_LVDTS,
         num_accelerometers=NUM_ACCELS,
@@ -272,49 +309,37 @@ def main():
         post_event_time=POST_EVENT_TIME,
         min_event_duration=MIN_EVENT_DURATION,
         lvdt_slopes=LVDT_SLOPES,
-        enable_plots=enable_plots,
-        enable_plot_displacement=enable_plot_displacement,
-        enable_accel_plots=enable_accel_plots,
-        enable_fft_plots=enable_fft_plots
+        enable_plots=settings.enable_plots,
+        enable_plot_displacement=settings.enable_plot_displacement,
+        enable_accel_plots=settings.enable_accel_plots,
+        enable_fft_plots=settings.enable_fft_plots,
+        reuse_accel_calibration=not args.recalibrate,
     )
-    
-    # Assign LVDT slopes as an attribute after creating the config object
-    config.lvdt_slopes = LVDT_SLOPES
-    print(f"LVDT slopes configured: {LVDT_SLOPES}")
-    
-    # keep originals for printouts
-    config.expected_sampling_rate_acceleration = config.sampling_rate_acceleration
-    config.expected_sampling_rate_lvdt        = config.sampling_rate_lvdt
-
-    print(f"Operation: {get_operation_mode_name()}")
-    print("\nSensor Configuration:")
-    print(f"  - LVDT Enabled: {enable_lvdt}")
-    print(f"  - Accelerometer Enabled: {enable_accel}")
-    print("\nVisualization Configuration:")
-    print(f"  - LVDT Displacement Plots: {enable_plot_displacement}")
-    print(f"  - Acceleration Plots: {enable_accel_plots}")
-    print(f"  - FFT Plots: {enable_fft_plots}")
-    print("\nSampling Rates:")
-    print(f"  - Accelerometer Rate: {ACCEL_SAMPLING_RATE} Hz")
-    print(f"  - LVDT Rate: {LVDT_SAMPLING_RATE} Hz")
-    print(f"  - Plot Refresh Rate: {PLOT_REFRESH_RATE} Hz, Plot Window: {WINDOW_DURATION} s")
-    print("\nEvent Detection Parameters:")
-    print(f"  - Acceleration Trigger Threshold: {ACCEL_TRIGGER_THRESHOLD} m/s2")
-    print(f"  - Displacement Trigger Threshold: {DISPLACEMENT_TRIGGER_THRESHOLD} mm")
-    print(f"  - Pre-Trigger Buffer: {PRE_EVENT_TIME} seconds")
-    print(f"  - Post-Trigger Buffer: {POST_EVENT_TIME} seconds")
-    print(f"  - Minimum Event Duration: {MIN_EVENT_DURATION} seconds")
-
-    if args.output_dir:
-        config.output_dir = args.output_dir
-        config.events_dir = os.path.join(config.output_dir, "events")
-        config.logs_dir = os.path.join(config.output_dir, "logs")
-        config.reports_dir = os.path.join(config.output_dir, "reports")
-        os.makedirs(config.events_dir, exist_ok=True)
-        os.makedirs(config.logs_dir, exist_ok=True)
-        os.makedirs(config.reports_dir, exist_ok=True)
-
-    config.operational_mode = get_operation_mode_name()
+    operation_mode = get_operation_mode_name(settings)
+    # Emit the whole configuration summary with a single write
+    print("\n".join([
+        f"LVDT slopes configured: {config.lvdt_slopes}",
+        f"Operation: {operation_mode}",
+        "\nSensor Configuration:",
+        f"  - LVDT Enabled: {settings.enable_lvdt}",
+        f"  - Accelerometer Enabled: {settings.enable_accel}",
+        "\nVisualization Configuration:",
+        f"  - LVDT Displacement Plots: {settings.enable_plot_displacement}",
+        f"  - Acceleration Plots: {settings.enable_accel_plots}",
+        f"  - FFT Plots: {settings.enable_fft_plots}",
+        "\nSampling Rates:",
+        f"  - Accelerometer Rate: {settings.accel_sampling_rate} Hz",
+        f"  - LVDT Rate: {settings.lvdt_sampling_rate} Hz",
+        f"  - Plot Refresh Rate: {settings.plot_refresh_rate} Hz, Plot Window: {WINDOW_DURATION} s",
+        "\nEvent Detection Parameters:",
+        f"  - Acceleration Trigger Threshold: {ACCEL_TRIGGER_THRESHOLD} m/s2",
+        f"  - Displacement Trigger Threshold: {DISPLACEMENT_TRIGGER_THRESHOLD} mm",
+        f"  - Pre-Trigger Buffer: {PRE_EVENT_TIME} seconds",
+        f"  - Post-Trigger Buffer: {POST_EVENT_TIME} seconds",
+        f"  - Minimum Event Duration: {MIN_EVENT_DURATION} seconds",
+    ]))
+
+    config.operational_mode = operation_mode
 
     monitor_system = MonitoringSystem(config)
     monitor_system.plot_queue = None
@@ -322,13 +347,8 @@ def main():
     try:
         monitor_system.setup_sensors()
 
-        # turn ON status LED continuously
-        if monitor_system.status_led:
-            monitor_system.status_led.on()
-
-        # ensure activity LED is off initially
-        if hasattr(monitor_system, "activity_led") and monitor_system.activity_led:
-            monitor_system.activity_led.off()
+        system_report_file = os.path.join(config.reports_dir, "system_report.txt")
+        report_generator.generate_system_report(config, system_report_file)
 
         # Add visualization if enabled
         if config.enable_lvdt:
@@ -338,63 +358,22 @@ def main():
         print("\n================== Init data processing =====================\n")
         config.window_duration = WINDOW_DURATION  # seconds of data visible
 
-        system_report_file = os.path.join(config.reports_dir, "system_report.txt")
-        report_generator.generate_system_report(config, system_report_file)
-
         monitor_system.start_monitoring()
 
-        # monitor loop: blink activity LED only during events
-        last_event_state = False # Use a different variable name to avoid confusion
-        while monitor_system.running:
-            try:
-                # --- CORRECTED STATE READING ---
-                # Read the shared state variable updated by event_monitoring.py
-                current_event_state = state.get_event_variable("is_event_recording", default=False)
-                # -------------------------------
-
-                # Check if the activity LED object exists and is usable
-                activity_led_available = hasattr(monitor_system, "activity_led") and monitor_system.activity_led is not None
-
-                # Start blinking activity LED when event begins
-                if current_event_state and not last_event_state:
-                    if activity_led_available:
-                        print("DEBUG INIT: Event started, starting blink.") # Debug print
-                        monitor_system.activity_led.blink(on_time=0.1, off_time=0.1, background=True)
-                    else:
-                        print("DEBUG INIT: Event started (LED missing/failed)") # Debug print
-
-                # Stop blinking when event ends
-                elif not current_event_state and last_event_state:
-                    if activity_led_available:
-                        print("DEBUG INIT: Event ended, stopping blink.") # Debug print
-                        monitor_system.activity_led.off()
-                    else:
-                        print("DEBUG INIT: Event ended (LED missing/failed)") # Debug print
-
-                last_event_state = current_event_state # Update state for next iteration
-
-            except Exception as loop_err:
-                print(f"Error in main monitoring loop: {loop_err}", file=sys.stderr)
-                traceback.print_exc() # Print full traceback for loop errors
-                # Optionally disable LED on repeated errors
-                if 'monitor_system' in locals() and hasattr(monitor_system, "activity_led"):
-                    monitor_system.activity_led = None
-
-
-            # Check state more frequently to react faster to event end
-            time.sleep(0.1) # Reduced sleep time
+        # MonitoringSystem drives the status and activity LEDs itself
+        monitor_system.wait_for_completion()
 
     except KeyboardInterrupt:
         print("\nProgram stopped by user")
-        if 'monitor_system' in locals() and monitor_system.running:
+        if monitor_system.running:
             monitor_system.stop_monitoring()
     except Exception as e:
         print(f"\nError in monitoring system: {e}")
+        import traceback
         traceback.print_exc()
     finally:
         print("\nCleaning up...")
-        if 'monitor_system' in locals():
-            monitor_system.cleanup()
+        monitor_system.cleanup()
         print("Done!")
 
 
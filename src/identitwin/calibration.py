@@ -2,6 +2,7 @@
 
 import time
 import os
+import json
 from datetime import datetime
 import numpy as np
 from typing import List, Dict, Optional
@@ -17,6 +18,8 @@ Provides functions to:
     - Calibrate multiple accelerometers (MPU6050) by calculating bias offsets
       while assuming they are stationary.
     - Apply calculated offsets to raw accelerometer data.
+    - Cache accelerometer offsets between runs so a restart can skip the
+      stationary data collection.
     - Save calibration results (LVDT intercepts, accelerometer offsets) to a
       log file.
 """
@@ -283,6 +286,69 @@ def calibrate_accelerometer(data: dict, offsets: Optional[Dict]) -> dict:
     return calibrated_data
 
 
+def _accelerometer_addresses(mpu_list: List[object]) -> List[Optional[int]]:
+    """Returns the I2C address of each accelerometer (None if unknown)."""
+    return [getattr(mpu, 'address', getattr(mpu, 'addr', None)) for mpu in mpu_list]
+
+
+def load_accelerometer_offsets(cache_file: str, mpu_list: List[object]) -> Optional[List[Dict]]:
+    """Loads cached accelerometer offsets saved by `save_accelerometer_offsets`.
+
+    The cache is only used if it was written for the same accelerometers
+    (same count and I2C addresses) and holds a valid offset for each of them.
+
+    Args:
+        cache_file (str): Path to the JSON cache file.
+        mpu_list (List[object]): The accelerometer objects to be calibrated.
+
+    Returns:
+        Optional[List[Dict]]: The cached offsets {'x', 'y', 'z'} per
+        accelerometer, or None if there is no usable cache.
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        offsets = cached['offsets']
+        if cached['addresses'] != _accelerometer_addresses(mpu_list) or len(offsets) != len(mpu_list):
+            return None
+        if not all(isinstance(o, dict) and all(k in o for k in ['x', 'y', 'z']) for o in offsets):
+            return None
+        return [{'x': float(o['x']), 'y': float(o['y']), 'z': float(o['z'])} for o in offsets]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Warning: Ignoring unreadable accelerometer calibration cache '{cache_file}': {e}")
+        return None
+
+
+def save_accelerometer_offsets(cache_file: str, mpu_list: List[object], offsets: List[Optional[Dict]]) -> bool:
+    """Saves accelerometer offsets so later runs can reuse them.
+
+    Nothing is written if calibration failed for any accelerometer.
+
+    Args:
+        cache_file (str): Path to the JSON cache file.
+        mpu_list (List[object]): The calibrated accelerometer objects.
+        offsets (List[Optional[Dict]]): Offsets returned by
+            `multiple_accelerometers`.
+
+    Returns:
+        bool: True if the cache was written, False otherwise.
+    """
+    if not cache_file or not offsets or any(o is None for o in offsets):
+        return False
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'addresses': _accelerometer_addresses(mpu_list),
+                'offsets': [{k: float(o[k]) for k in ['x', 'y', 'z']} for o in offsets],
+            }, f, indent=2)
+        return True
+    except OSError as e:
+        print(f"Warning: Could not save accelerometer calibration cache '{cache_file}': {e}")
+        return False
+
+
 def _save_calibration_data(config: object, lvdt_systems: Optional[List[Optional[Dict]]] = None, accel_offsets: Optional[List[Optional[Dict]]] = None) -> Optional[str]:
     """Saves LVDT and/or accelerometer calibration data to a log file.
 
@@ -9,6 +9,8 @@ are skipped or simulated.
 
 Attributes:
     IS_RASPBERRY_PI (bool): True if the system detects it's running on Linux.
+    SIMULATION_ONLY (bool): True if the `IDENTITWIN_SIMULATION` environment
+        variable is set (and not "0"); hardware libraries are then not imported.
     I2C_AVAILABLE (bool): True if hardware libraries were imported and I2C bus
         communication check succeeded.
     LED (class or None): The `gpiozero.LED` class if available, otherwise None.
@@ -20,26 +22,30 @@ Attributes:
 """
 import os
 import platform
-from datetime import datetime
 import time
-import numpy as np
 import sys # Import sys for stderr
-import traceback # Import traceback for detailed errors
+import logging
 import warnings # Import warnings to suppress hardware-related warnings
 
 # Suppress warnings related to hardware detection
 warnings.filterwarnings("ignore", category=RuntimeWarning)
-warnings.filterwarnings("ignore", message=".*chip_id.*")
-warnings.filterwarnings("ignore", message=".*Adafruit-PlatformDetect.*")
-warnings.filterwarnings("ignore", message=".*chip_id == None.*")
+warnings.filterwarnings("ignore", message=".*(chip_id|Adafruit-PlatformDetect)")
+
+# Query the platform once; reused by the platform banners
+_SYSTEM = platform.system()
+_RELEASE = platform.release()
 
 # Check if we're running on Linux (likely Raspberry Pi)
-IS_RASPBERRY_PI = platform.system() == "Linux"
+IS_RASPBERRY_PI = _SYSTEM == "Linux"
+# Set by callers that already know no hardware will be used (e.g. --simulation)
+SIMULATION_ONLY = os.environ.get("IDENTITWIN_SIMULATION", "0") not in ("", "0")
 I2C_AVAILABLE = False  # Default to False until proven otherwise
 LED = None # Define LED as None initially
+_I2C_BUS = None  # Shared I2C bus handle, created on first use
+_LVDT_PINS = ()  # ADS1115 input pins in LVDT order (P0, P1, ...), set if the driver loads
 
-# Only attempt to import hardware libraries if on Linux
-if IS_RASPBERRY_PI: # Check if it's Linux first
+# Only attempt to import hardware libraries if on Linux and hardware is wanted
+if IS_RASPBERRY_PI and not SIMULATION_ONLY: # Check if it's Linux first
     try:
         from gpiozero import LED # Now LED is the actual class if import succeeds
         import adafruit_ads1x15.ads1115 as ADS
@@ -47,6 +53,10 @@ if IS_RASPBERRY_PI: # Check if it's Linux first
         import busio
         from adafruit_ads1x15.analog_in import AnalogIn
         from mpu6050 import mpu6050
+        try:
+            _LVDT_PINS = (ADS.P0, ADS.P1, ADS.P2, ADS.P3)
+        except AttributeError as pin_err:
+            print(f"ADS1115 driver does not expose the expected pin constants ({pin_err}). LVDT channels unavailable.")
         # Check if I2C is actually working (optional but good)
         try:
             i2c_test = busio.I2C(board.SCL, board.SDA)
@@ -69,7 +79,10 @@ if IS_RASPBERRY_PI: # Check if it's Linux first
         mpu6050 = None
         I2C_AVAILABLE = False
 else:
-     print("Note: Not running on Linux. Hardware control disabled. Running in software simulation mode.")
+     if SIMULATION_ONLY:
+          print("Note: IDENTITWIN_SIMULATION is set. Hardware libraries not loaded. Running in software simulation mode.")
+     else:
+          print("Note: Not running on Linux. Hardware control disabled. Running in software simulation mode.")
      # Ensure all hardware variables are None on non-Linux
      LED = None
      ADS = None
@@ -80,9 +93,53 @@ else:
      I2C_AVAILABLE = False
 
 
-# Print platform information
-print(f"Platform: {platform.system()} {platform.release()}")
-print(f"Hardware mode: {'Raspberry Pi/Hardware' if I2C_AVAILABLE else 'Software Simulation'}")
+def _get_i2c_bus():
+    """Returns the shared I2C bus, creating it on first use.
+
+    Every ADC created by `SystemConfig.create_ads1115` talks over this single
+    handle instead of opening the bus again.
+
+    Returns:
+        busio.I2C: The shared I2C bus object.
+    """
+    global _I2C_BUS
+    if _I2C_BUS is None:
+        _I2C_BUS = busio.I2C(board.SCL, board.SDA)
+    return _I2C_BUS
+
+
+def _scan_i2c_addresses():
+    """Lists the addresses that acknowledge on the shared I2C bus.
+
+    Returns:
+        set[int] or None: The responding 7-bit addresses, or None if the bus
+        could not be scanned or its lock was not acquired within 1 s.
+    """
+    try:
+        bus = _get_i2c_bus()
+        deadline = time.monotonic() + 1.0
+        while not bus.try_lock():
+            if time.monotonic() >= deadline:
+                print("Warning: I2C bus scan skipped, bus is busy", file=sys.stderr)
+                return None
+            time.sleep(0.01)
+        try:
+            return set(bus.scan())
+        finally:
+            bus.unlock()
+    except Exception as e:
+        print(f"Warning: I2C bus scan failed: {e}", file=sys.stderr)
+        return None
+
+
+def describe_platform():
+    """Prints the detected platform and whether hardware mode is available.
+
+    Not called on import so that importing the module stays silent;
+    applications that want the banner call it explicitly.
+    """
+    print(f"Platform: {_SYSTEM} {_RELEASE}")
+    print(f"Hardware mode: {'Raspberry Pi/Hardware' if I2C_AVAILABLE else 'Software Simulation'}")
 
 
 class SystemConfig:
@@ -135,8 +192,30 @@ class SystemConfig:
         enable_fft_plots (bool): Enable/disable FFT plot tab.
         lvdt_calibration (list): Stores calibration data populated by calibration functions.
         accel_offsets (list): Stores calibration offsets populated by calibration functions.
+        reuse_accel_calibration (bool): Reuse cached accelerometer offsets instead
+            of recalibrating when the cache matches the connected sensors.
+        accel_calibration_file (str): Path of the accelerometer offset cache.
+        operational_mode (str): Human-readable mode name, set by the caller
+            after construction and used in the system report.
     """
 
+    __slots__ = (
+        "output_dir", "events_dir", "logs_dir", "reports_dir",
+        "acceleration_file", "displacement_file", "general_file",
+        "enable_performance_monitoring", "performance_log_file",
+        "enable_lvdt", "enable_accel", "num_lvdts", "lvdt_slopes", "num_accelerometers",
+        "sampling_rate_acceleration", "sampling_rate_lvdt", "plot_refresh_rate",
+        "time_step_acceleration", "time_step_lvdt", "time_step_plot_refresh",
+        "window_duration", "gravity", "max_accel_jitter", "max_lvdt_jitter",
+        "trigger_acceleration_threshold", "trigger_displacement_threshold",
+        "detrigger_acceleration_threshold", "detrigger_displacement_threshold",
+        "pre_event_time", "post_event_time", "min_event_duration",
+        "lvdt_gain", "lvdt_scale_factor", "gpio_pins",
+        "enable_plots", "enable_plot_displacement", "enable_accel_plots", "enable_fft_plots",
+        "lvdt_calibration", "accel_offsets", "reuse_accel_calibration", "accel_calibration_file",
+        "operational_mode",
+    )
+
     def __init__(
         self,
         enable_lvdt=True,
@@ -160,6 +239,7 @@ class SystemConfig:
         enable_plot_displacement=True,
         enable_accel_plots=True,
         enable_fft_plots=True,
+        reuse_accel_calibration=False,
     ):
         """Initializes the system configuration.
 
@@ -191,24 +271,31 @@ class SystemConfig:
             enable_plot_displacement (bool): Enable LVDT plot tab.
             enable_accel_plots (bool): Enable Accelerometer plot tab.
             enable_fft_plots (bool): Enable FFT plot tab.
+            reuse_accel_calibration (bool): Reuse cached accelerometer offsets
+                from a previous run in the same output directory.
         """
         # Set output directory first to avoid the AttributeError
         self.output_dir = output_dir
         if self.output_dir is None:
-            today = datetime.now().strftime("%Y%m%d")
+            today = time.strftime("%Y%m%d")
             self.output_dir = os.path.join("repository", today)
 
-        # Create all required subdirectories
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Create standard subdirectories
+        # Standard subdirectories
         self.events_dir = os.path.join(self.output_dir, "events")
         self.logs_dir = os.path.join(self.output_dir, "logs")
         self.reports_dir = os.path.join(self.output_dir, "reports")
         
-        # Create all subdirectories
-        for directory in [self.events_dir, self.logs_dir, self.reports_dir]:
-            os.makedirs(directory, exist_ok=True)
+        # On repeat runs everything already exists and nothing is created
+        subdirs = (self.events_dir, self.logs_dir, self.reports_dir)
+        if not all(os.path.isdir(directory) for directory in subdirs):
+            # Create the output directory (and its parents) once
+            os.makedirs(self.output_dir, exist_ok=True)
+            # Their parent now exists, so a single mkdir each avoids re-checking the ancestors
+            for directory in subdirs:
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    pass
             
         # Set default file paths
         self.acceleration_file = os.path.join(self.output_dir, "acceleration.csv")
@@ -286,7 +373,7 @@ class SystemConfig:
             )
         if self.sampling_rate_lvdt != sampling_rate_lvdt:
             print(f"Warning: LVDT rate limited to {self.sampling_rate_lvdt} Hz (requested: {sampling_rate_lvdt} Hz)")
-        if self.plot_refresh_rate != 10.0:
+        if self.plot_refresh_rate != plot_refresh_rate:
             print(
                 f"Warning: Plot refresh rate limited to {self.plot_refresh_rate} Hz (requested: {plot_refresh_rate} Hz)"
             )
@@ -294,6 +381,8 @@ class SystemConfig:
         # Initialize calibration attributes
         self.lvdt_calibration = [None] * self.num_lvdts
         self.accel_offsets = [None] * self.num_accelerometers
+        self.reuse_accel_calibration = reuse_accel_calibration
+        self.accel_calibration_file = os.path.join(self.output_dir, "accel_calibration.json")
 
     def _initialize_output_directory(self, custom_dir=None):
         """Initializes and returns the path to the session's output directory.
@@ -316,7 +405,7 @@ class SystemConfig:
             os.makedirs(base_folder)
 
         # Create a subfolder for this monitoring session with date only
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = time.strftime("%Y-%m-%d")
         session_path = os.path.join(base_folder, today)
 
         # Create the session directory if it doesn't exist
@@ -403,15 +492,13 @@ class SystemConfig:
             print("Error: Cannot create ADS1115, required hardware libraries not available or I2C failed.")
             return None
         try:
-            # Initialize I2C bus
-            i2c = busio.I2C(board.SCL, board.SDA)
-            ads = ADS.ADS1115(i2c)
+            ads = ADS.ADS1115(_get_i2c_bus())
             ads.gain = self.lvdt_gain   # Gain of 2/3 (+-6.144V)
             print("ADS1115 initialized successfully.")
             return ads
         except Exception as e:
             print(f"Error initializing ADS1115: {e}")
-            traceback.print_exc()
+            logging.debug("ADS1115 initialization failed", exc_info=True)
             return None
 
     def create_lvdt_channels(self, ads):
@@ -435,7 +522,7 @@ class SystemConfig:
 
         try:
             channels = []
-            pins = [ADS.P0, ADS.P1, ADS.P2, ADS.P3][:self.num_lvdts]  # Default pin configuration
+            pins = _LVDT_PINS[:self.num_lvdts]  # Default pin configuration
             for i, pin in enumerate(pins):
                 try:
                     # Initialize the channel and test voltage reading
@@ -452,16 +539,25 @@ class SystemConfig:
             return channels
         except Exception as e:
             print(f"Error creating LVDT channels: {e}")
-            traceback.print_exc()
+            logging.debug("LVDT channel creation failed", exc_info=True)
             return None
 
+    def refresh_lvdt_channels(self):
+        """Latches a new sample for all LVDT channels before a sweep.
+
+        The ADS1115 converts on every read, so there is nothing to do on
+        hardware. `SimulatorConfig` overrides this to advance its shared
+        signal bank once per acquisition cycle.
+        """
+
     def create_accelerometers(self):
         """Creates and initializes MPU6050 accelerometer objects via I2C.
 
         Attempts to instantiate `mpu6050.mpu6050` objects for the configured
         number of accelerometers, assuming consecutive I2C addresses starting
-        from 0x68. Performs a basic communication check (reading temperature)
-        for each sensor.
+        from 0x68. The bus is scanned once up front so only addresses that
+        acknowledge are opened; if the scan fails, each sensor is instead
+        checked by reading its temperature.
 
         Requires `mpu6050`, `board`, `busio` libraries and working I2C.
 
@@ -475,15 +571,22 @@ class SystemConfig:
             return None
 
         mpu_list = []
+        present = _scan_i2c_addresses()
         print(f"\nInitialize {self.num_accelerometers} accelerometers...")
         for i in range(self.num_accelerometers):
             addr = 0x68 + i  # Assumes sensors on consecutive I2C addresses (0x68, 0x69, ...)
+            if present is not None and addr not in present:
+                print(f"  Warning: No device answered at address {hex(addr)}. Skipping this sensor.", file=sys.stderr)
+                continue
             try:
                 # Instantiate mpu6050 directly with the address
                 print(f"- Initialize MPU6050 at address {hex(addr)}...")
                 mpu = mpu6050(addr)
+                if present is not None:
+                    mpu_list.append(mpu)  # Already confirmed by the bus scan
+                    continue
 
-                # Optional: Add a quick check to see if the sensor is responsive
+                # Without a scan, check that the sensor is responsive
                 try:
                     temp = mpu.get_temp()  # Try reading temperature
                     mpu_list.append(mpu)
@@ -18,6 +18,7 @@ Key Features:
 import os
 import csv
 import time
+import math
 import queue
 import traceback
 import numpy as np
@@ -63,6 +64,12 @@ class EventMonitor:
         disp_buffer (deque): Buffer for calculating moving average of displacement.
         moving_avg_accel (float): Current moving average of acceleration magnitude.
         moving_avg_disp (float): Current moving average of displacement.
+        _accel_sum (float): Running sum of `accel_buffer`, kept in step with it.
+        _disp_sum (float): Running sum of `disp_buffer`, kept in step with it.
+        _trigger_accel (float): Acceleration trigger threshold read from `thresholds`.
+        _trigger_disp (float): Displacement trigger threshold read from `thresholds`.
+        _detrigger_accel (float): Acceleration detrigger threshold read from `thresholds`.
+        _detrigger_disp (float): Displacement detrigger threshold read from `thresholds`.
         error_count (int): Counter for consecutive errors during event detection.
         max_errors (int): Threshold for logging repeated errors.
         finalize_thread_started (bool): Flag to prevent multiple saving threads for one event.
@@ -82,6 +89,12 @@ class EventMonitor:
         self.config = config
         self.data_queue = data_queue
         self.thresholds = thresholds
+        # Thresholds are fixed for the monitor's lifetime; resolve them once
+        # instead of on every sample in detect_event
+        self._trigger_accel = thresholds.get("acceleration", 0.981)
+        self._trigger_disp = thresholds.get("displacement", 2.0)
+        self._detrigger_accel = thresholds.get("detrigger_acceleration", self._trigger_accel * 0.5)
+        self._detrigger_disp = thresholds.get("detrigger_displacement", self._trigger_disp * 0.5)
         self.running_ref = running_ref
         self.event_count_ref = event_count_ref
         self.event_in_progress = False
@@ -115,6 +128,8 @@ class EventMonitor:
         self.disp_buffer = deque(maxlen=max(1, window_size_lvdt)) # Ensure maxlen >= 1
         self.moving_avg_accel = 0.0
         self.moving_avg_disp = 0.0
+        self._accel_sum = 0.0
+        self._disp_sum = 0.0
 
         # Initialize event count in state with current value
         state.set_event_variable("event_count", event_count_ref[0])
@@ -164,26 +179,34 @@ class EventMonitor:
             # Calculate magnitudes for all accelerometers
             for accel in accel_data:
                 if all(k in accel for k in ['x', 'y', 'z']):
-                    mag = np.sqrt(accel["x"]**2 + accel["y"]**2 + accel["z"]**2)
+                    x, y, z = accel["x"], accel["y"], accel["z"]
+                    mag = math.sqrt(x * x + y * y + z * z)  # Scalar math avoids NumPy call overhead
                     accel_magnitudes.append(mag)
             # Calculate displacements for all LVDTs
             for lvdt in lvdt_data:
                 disp = abs(lvdt.get("displacement", 0))
                 disp_values.append(disp)
 
-            # Update buffers for moving averages (optional, can use first sensor as before)
+            # Update moving averages incrementally (first sensor of each type):
+            # drop the value about to be evicted from the sum, then add the new one
             if accel_magnitudes:
+                if len(self.accel_buffer) == self.accel_buffer.maxlen:
+                    self._accel_sum -= self.accel_buffer[0]
                 self.accel_buffer.append(accel_magnitudes[0])
-                self.moving_avg_accel = np.mean(self.accel_buffer)
+                self._accel_sum += accel_magnitudes[0]
+                self.moving_avg_accel = self._accel_sum / len(self.accel_buffer)
             if disp_values:
+                if len(self.disp_buffer) == self.disp_buffer.maxlen:
+                    self._disp_sum -= self.disp_buffer[0]
                 self.disp_buffer.append(disp_values[0])
-                self.moving_avg_disp = np.mean(self.disp_buffer)
+                self._disp_sum += disp_values[0]
+                self.moving_avg_disp = self._disp_sum / len(self.disp_buffer)
 
             # Event detection logic (multi-sensor, multi-channel)
-            trigger_accel = self.thresholds.get("acceleration", 0.981)
-            trigger_disp = self.thresholds.get("displacement", 2.0)
-            detrigger_accel = self.thresholds.get("detrigger_acceleration", trigger_accel * 0.5)
-            detrigger_disp = self.thresholds.get("detrigger_displacement", trigger_disp * 0.5)
+            trigger_accel = self._trigger_accel
+            trigger_disp = self._trigger_disp
+            detrigger_accel = self._detrigger_accel
+            detrigger_disp = self._detrigger_disp
 
             # Check if any sensor is above trigger threshold
             accel_trigger = any(mag > trigger_accel for mag in accel_magnitudes)
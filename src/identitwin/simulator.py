@@ -1,15 +1,12 @@
 """Simulation configuration and dummy hardware implementations.
 
-Provides a `SimulatorConfig` class that mirrors `SystemConfig` but replaces
+Provides a `SimulatorConfig` subclass of `SystemConfig` that replaces
 hardware initialization calls with dummy objects (`DummyADS`, `DummyAnalogIn`,
 `DummyMPU6050`). Allows running the IdentiTwin system without actual hardware,
 generating simulated sensor data for testing and development.
 
 Suppresses hardware-related warnings when running in simulation mode.
 """
-import os
-import platform
-from datetime import datetime
 import time
 import math
 import numpy as np
@@ -17,6 +14,8 @@ import random  # Add this import
 import warnings  # For suppressing warnings
 import colorama # Import colorama
 
+from .configurator import SystemConfig, describe_platform
+
 # Initialize colorama
 colorama.init(autoreset=True) # autoreset=True automatically adds Fore.RESET after each print
 
@@ -25,41 +24,164 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 warnings.filterwarnings("ignore", message=".*chip_id.*")
 warnings.filterwarnings("ignore", message=".*Adafruit-PlatformDetect.*")
 
+# Pre-drawn unit noise shared by the simulated sensors, read as a ring buffer
+_RNG = np.random.default_rng()
+_NOISE_SIZE = 1 << 16
+_NOISE = _RNG.uniform(-1.0, 1.0, _NOISE_SIZE)
+_noise_index = 0
+
+def _draw_noise(n):
+    """Returns the next `n` samples of unit noise from the pre-drawn buffer.
+
+    Avoids a call into the random generator for every simulated sample.
+
+    Args:
+        n (int): Number of samples to return (at most `_NOISE_SIZE`).
+
+    Returns:
+        np.ndarray: Uniform noise in [-1, 1).
+    """
+    global _noise_index
+    start = _noise_index
+    end = start + n
+    _noise_index = end & (_NOISE_SIZE - 1)
+    if end <= _NOISE_SIZE:
+        return _NOISE[start:end]
+    return np.concatenate((_NOISE[start:], _NOISE[:end - _NOISE_SIZE]))
+
+def _lvdt_voltage(elapsed, amplitude, omega, phase, noise):
+    """Evaluates the simulated LVDT signal at a given elapsed time.
+
+    Kept as a plain module-level function so the per-sample math does not go
+    through instance attribute lookups. Works on scalars as well as on NumPy
+    arrays holding one entry per channel. The noise term is drawn by the caller.
+
+    Args:
+        elapsed (float): Time elapsed since the signal source was created (s).
+        amplitude (float): Peak-to-peak amplitude of the sine wave (V).
+        omega (float): Angular frequency of the sine wave (rad/s).
+        phase (float or np.ndarray): Phase shift of each channel (rad).
+        noise (float or np.ndarray): Noise value(s) to add to the signal (V).
+
+    Returns:
+        float or np.ndarray: The simulated voltage(s).
+    """
+    return amplitude * np.sin(omega * elapsed + phase) / 2 + noise
+
 # Dummy classes to simulate hardware
 
 class DummyADS:
     """Dummy class simulating the ADS1115 ADC."""
+    __slots__ = ("gain",)
+
     def __init__(self):
         """Initializes the dummy ADS."""
         self.gain = None
 
-class DummyAnalogIn:
-    """Dummy class simulating an analog input channel on the ADS1115.
+class DummyLVDTBank:
+    """Shared signal source for all simulated LVDT channels.
 
-    Generates a simulated LVDT signal consisting of a low-frequency sine wave
-    with added noise. Stores calibration parameters set via `set_calibration`.
+    Evaluates the signal of every channel in a single vectorized call, so all
+    channels of a batch share one monotonic timestamp. Once `refresh` has been
+    called, reads are served from that latched batch until the next `refresh`,
+    so one acquisition cycle costs one evaluation however often each channel
+    is read. Before the first `refresh` (e.g. during calibration) every read
+    samples the signal afresh.
 
     Attributes:
-        pin (int): The simulated pin number.
-        _start_time (float): Time when the instance was created.
+        num_channels (int): Number of channels served by the bank.
+        _start_time (float): Monotonic time when the bank was created.
         _amplitude (float): Amplitude of the simulated sine wave voltage.
         _frequency (float): Frequency of the simulated sine wave voltage.
+        _omega (float): Angular frequency derived from `_frequency` (rad/s).
         _noise_level (float): Amplitude of the random noise added to the signal.
+        _phases (np.ndarray): Phase shift of each channel (rad). All zero, so
+            every channel follows the same signal as the original per-channel
+            simulator.
+        _voltages (np.ndarray or None): Batch latched by the last `refresh`,
+            or None if `refresh` has not been called yet.
+    """
+    __slots__ = ("num_channels", "_start_time", "_amplitude", "_frequency", "_omega",
+                 "_noise_level", "_phases", "_voltages")
+
+    def __init__(self, num_channels):
+        """Initializes the LVDT signal bank.
+
+        Args:
+            num_channels (int): Number of simulated LVDT channels.
+        """
+        self.num_channels = num_channels
+        self._start_time = time.monotonic()
+        self._amplitude = 0.5  # 0.5V amplitud
+        self._frequency = 0.1  # 0.1 Hz = 1 ciclo cada 10 segundos
+        self._omega = 2 * np.pi * self._frequency
+        self._noise_level = 0.01  # 10mV de ruido
+        self._phases = np.zeros(num_channels)
+        self._voltages = None
+
+    def _sample(self):
+        """Evaluates the signal of all channels at the current time.
+
+        Returns:
+            np.ndarray: One voltage per channel.
+        """
+        t = time.monotonic() - self._start_time
+        noise = self._noise_level * _draw_noise(self.num_channels)
+        return _lvdt_voltage(t, self._amplitude, self._omega, self._phases, noise)
+
+    def refresh(self):
+        """Latches a new batch of voltages for all channels.
+
+        Called once per acquisition cycle so every channel read in that cycle
+        refers to the same instant.
+        """
+        self._voltages = self._sample()
+
+    def read(self, channel):
+        """Returns the voltage of a channel.
+
+        Args:
+            channel (int): Index of the channel within the bank.
+
+        Returns:
+            float: The latched voltage, or a fresh sample if `refresh` has
+            not been called yet.
+        """
+        voltages = self._voltages
+        if voltages is None:
+            voltages = self._sample()
+        return float(voltages[channel])
+
+class DummyAnalogIn:
+    """Dummy class simulating an analog input channel on the ADS1115.
+
+    Reads a simulated LVDT signal (a low-frequency sine wave with added noise)
+    from a `DummyLVDTBank` shared by all channels. Stores calibration
+    parameters set via `set_calibration`.
+
+    Attributes:
+        pin (int): The simulated pin number, used as the channel index in the bank.
         calibration_slope (float or None): LVDT calibration slope (mm/V).
         calibration_intercept (float or None): LVDT calibration intercept (mm).
     """
-    def __init__(self, ads, pin):
+    __slots__ = ("pin", "_channel", "_bank", "calibration_slope", "calibration_intercept")
+
+    def __init__(self, ads, pin, bank=None):
         """Initializes the dummy analog input channel.
 
         Args:
             ads (DummyADS): The dummy ADS instance.
             pin (int): The simulated pin number associated with this channel.
+            bank (DummyLVDTBank, optional): Signal source shared with the other
+                channels. Defaults to a private single-channel bank.
         """
         self.pin = pin
-        self._start_time = time.time()
-        self._amplitude = 0.5  # 0.5V amplitud
-        self._frequency = 0.1  # 0.1 Hz = 1 ciclo cada 10 segundos
-        self._noise_level = 0.01  # 10mV de ruido
+        if bank is None:
+            bank = DummyLVDTBank(1)
+            self._channel = 0
+        else:
+            self._channel = pin
+        self._bank = bank
         self.calibration_slope = None  # Será establecido durante la calibración
         self.calibration_intercept = None  # Será establecido durante la calibración
 
@@ -77,19 +199,28 @@ class DummyAnalogIn:
     def voltage(self):
         """Simulates reading the voltage from the LVDT channel.
 
-        Generates a voltage value based on a sine wave plus random noise.
-
         Returns:
             float: The simulated voltage reading.
         """
-        t = time.time() - self._start_time
-        base_signal = self._amplitude * math.sin(2 * math.pi * self._frequency * t) / 2
-        noise = random.uniform(-self._noise_level, self._noise_level)
-        return base_signal + noise
+        return self._bank.read(self._channel)
+
+# Simulated accelerometer tones, shape (signal, axis, term) with signal 0 the
+# constant noise and signal 1 the periodic excitation. Cosine terms are
+# expressed as sines shifted by pi/2 so one np.sin call covers every tone.
+_ACCEL_FREQUENCIES = np.array([
+    [[50, 80], [60, 100], [70, 90]],
+    [[20, 35], [22, 37], [20, 35]],
+])
+_ACCEL_OMEGAS = 2 * np.pi * _ACCEL_FREQUENCIES
+_ACCEL_PHASES = np.array([
+    [[0.0, 0.0], [np.pi / 2, np.pi / 2], [0.0, np.pi / 2]],
+    [[0.0, 0.0], [np.pi / 2, np.pi / 2], [0.0, 0.0]],
+])
+_ACCEL_AMPLITUDES = np.array([
+    [[0.0005, 0.0003], [0.0006, 0.0004], [0.0007, 0.0005]],
+    [[7.5, 1.5], [5.5, 1.5], [7.5, 1.5]],
+])
 
-import time
-import random
-import math
 
 class DummyMPU6050:
     """Dummy class simulating the MPU6050 accelerometer/gyroscope.
@@ -100,12 +231,14 @@ class DummyMPU6050:
 
     Attributes:
         addr (int): The simulated I2C address.
-        _cycle_start_time (float): Timestamp when the current noise/periodic cycle began.
+        _cycle_start_time (float): Monotonic time when the current noise/periodic cycle began.
         _current_interval (float): Duration of the current cycle (randomly generated).
         state (str): Current simulation state ('noise' or 'periodic').
         transition_progress (float): Progress (0 to 1) of the smooth transition
             between states.
     """
+    __slots__ = ("addr", "_cycle_start_time", "_current_interval", "state", "transition_progress")
+
     def __init__(self, addr):
         """Initializes the dummy MPU6050 sensor.
 
@@ -113,7 +246,7 @@ class DummyMPU6050:
             addr (int): The simulated I2C address for this sensor.
         """
         self.addr = addr
-        self._cycle_start_time = time.time()
+        self._cycle_start_time = time.monotonic()
         self._current_interval = self._generate_random_interval()
         self.state = "noise"  # Initial state: only noise
         self.transition_progress = 0  # Progress of the transition (0 to 1)
@@ -137,7 +270,7 @@ class DummyMPU6050:
             t (float): Time elapsed since the start of the current cycle.
         """
         if t >= self._current_interval:
-            self._cycle_start_time = time.time()
+            self._cycle_start_time = time.monotonic()
             self._current_interval = self._generate_random_interval()
             self.state = "periodic" if self.state == "noise" else "noise"
             self.transition_progress = 0  # Reset the transition
@@ -148,10 +281,11 @@ class DummyMPU6050:
         Used to smoothly fade the periodic signals in or out when the state changes.
 
         Args:
-            value (float): The original signal value.
+            value (float or np.ndarray): The original signal value(s).
 
         Returns:
-            float: The signal value scaled by the sigmoid transition factor.
+            float or np.ndarray: The signal value(s) scaled by the sigmoid
+                transition factor.
         """
         # Sigmoid function for a smoother transition
         sigmoid_progress = 1 / (1 + math.exp(-10 * (self.transition_progress - 0.5)))
@@ -168,7 +302,7 @@ class DummyMPU6050:
             dict: A dictionary containing simulated acceleration values for
                   'x', 'y', and 'z' axes in m/s².
         """
-        t = time.time() - self._cycle_start_time
+        t = time.monotonic() - self._cycle_start_time
 
         # Update the state if needed
         self._update_state(t)
@@ -176,219 +310,69 @@ class DummyMPU6050:
         # Increment the progress of the transition
         self.transition_progress = min(self.transition_progress + 0.01, 1)  # Progress in each call
 
-        # Constant noise
-        noise_x = 0.0005 * math.sin(t * 2 * math.pi * 50) + 0.0003 * math.sin(t * 2 * math.pi * 80)
-        noise_y = 0.0006 * math.cos(t * 2 * math.pi * 60) + 0.0004 * math.cos(t * 2 * math.pi * 100)
-        noise_z = 0.0007 * math.sin(t * 2 * math.pi * 70) + 0.0005 * math.cos(t * 2 * math.pi * 90)
+        # All tones in one call; rows are (noise, periodic), columns x/y/z
+        tones = (_ACCEL_AMPLITUDES * np.sin(_ACCEL_OMEGAS * t + _ACCEL_PHASES)).sum(axis=-1)
+        accel = tones[0]  # Constant noise
 
         if self.state == "periodic":
-            # Periodic signals
-            periodic_signal_x = 7.5 * math.sin(t * 2 * math.pi * 20) + 1.5 * math.sin(t * 2 * math.pi * 35)
-            periodic_signal_y = 5.5 * math.cos(t * 2 * math.pi * 22) + 1.5 * math.cos(t * 2 * math.pi * 37)
-            periodic_signal_z = 7.5 * math.sin(t * 2 * math.pi * 20) + 1.5 * math.sin(t * 2 * math.pi * 35)
-
-            # Apply the smooth transition to periodic signals
-            periodic_signal_x = self._apply_smooth_transition(periodic_signal_x)
-            periodic_signal_y = self._apply_smooth_transition(periodic_signal_y)
-            periodic_signal_z = self._apply_smooth_transition(periodic_signal_z)
-
-            return {
-                'x': noise_x + periodic_signal_x,
-                'y': noise_y + periodic_signal_y,
-                'z': 9.81 + noise_z + periodic_signal_z  # Gravity + noise + periodic signals
-            }
-        else:
-            # Only noise
-            return {
-                'x': noise_x,
-                'y': noise_y,
-                'z': 9.81 + noise_z  # Gravity + noise
-            }
+            # Add the periodic signals with the smooth transition applied
+            accel = accel + self._apply_smooth_transition(tones[1])
+
+        # Unbox once into plain floats; every sample gets its own dict because
+        # the acquisition queues keep references to it
+        x, y, z = accel.tolist()
+        return {'x': x, 'y': y, 'z': 9.81 + z}  # Gravity acts along Z
 
         
 # Simulated configuration class
-class SimulatorConfig:
-    """Configuration class for simulation mode. Mirrors `SystemConfig`.
+class SimulatorConfig(SystemConfig):
+    """Configuration class for simulation mode. Subclass of `SystemConfig`.
 
-    Provides the same configuration attributes as `SystemConfig` but includes
-    methods to create dummy hardware objects instead of real ones. Used to run
-    the system without requiring physical hardware connections.
+    Keeps every setting of `SystemConfig` and only overrides the hardware
+    factory methods so they return dummy objects instead of real ones. Used
+    to run the system without requiring physical hardware connections.
 
     Attributes:
         verbose (bool): Flag for enabling verbose output (currently unused).
-        enable_plots (bool): Enable/disable real-time plotting dashboard.
-        enable_plot_displacement (bool): Enable/disable LVDT plot tab.
-        enable_accel_plots (bool): Enable/disable Accelerometer plot tab.
-        enable_fft_plots (bool): Enable/disable FFT plot tab.
-        output_dir (str): Base directory for saving output files (logs, events, reports).
-        events_dir (str): Subdirectory for event-specific data.
-        logs_dir (str): Subdirectory for log files (performance, calibration).
-        reports_dir (str): Subdirectory for generated reports.
-        acceleration_file (str): Path for continuous acceleration CSV log (unused in sim).
-        displacement_file (str): Path for continuous displacement CSV log (unused in sim).
-        general_file (str): Path for combined sensor CSV log (unused in sim).
-        enable_performance_monitoring (bool): Enable/disable performance logging.
-        performance_log_file (str): Path for performance log CSV.
-        enable_lvdt (bool): Enable/disable LVDT simulation.
-        enable_accel (bool): Enable/disable accelerometer simulation.
-        num_lvdts (int): Number of simulated LVDTs.
-        num_accelerometers (int): Number of simulated accelerometers.
-        lvdt_slopes (list or None): List of slopes (mm/V) for LVDT calibration.
-        sampling_rate_acceleration (float): Target sampling rate for accelerometers (Hz).
-        sampling_rate_lvdt (float): Target sampling rate for LVDTs (Hz).
-        plot_refresh_rate (float): Target refresh rate for dashboard plots (Hz).
-        time_step_acceleration (float): Calculated time interval between accel samples (s).
-        time_step_lvdt (float): Calculated time interval between LVDT samples (s).
-        time_step_plot_refresh (float): Calculated time interval between plot updates (s).
-        window_duration (int): Duration for plotting windows (seconds, currently unused).
-        gravity (float): Standard gravity value (m/s²).
-        max_accel_jitter (float): Max allowed jitter for accel timing (ms, unused).
-        max_lvdt_jitter (float): Max allowed jitter for LVDT timing (ms, unused).
-        trigger_acceleration_threshold (float): Threshold for event triggering (m/s²).
-        trigger_displacement_threshold (float): Threshold for event triggering (mm).
-        detrigger_acceleration_threshold (float): Threshold for event detriggering (m/s²).
-        detrigger_displacement_threshold (float): Threshold for event detriggering (mm).
-        pre_event_time (float): Duration of data to save before an event trigger (s).
-        post_event_time (float): Duration of data to save after an event detrigger (s).
-        min_event_duration (float): Minimum duration for a valid event (s).
-        lvdt_gain (float): Simulated ADC gain setting.
-        lvdt_scale_factor (float): Simulated ADC scale factor (mV).
         lvdt_slope (float): Default LVDT slope if not provided (mm/V).
         lvdt_intercept (float): Default LVDT intercept (mm).
         accel_offsets (list): List of dummy accelerometer offsets.
-        gpio_pins (list or None): Simulated GPIO pin numbers for LEDs.
+        gpio_pins (list): Simulated GPIO pin numbers for LEDs ([None, None]
+            unless pins are given explicitly).
+        _lvdt_bank (DummyLVDTBank or None): Signal bank shared by the channels
+            from `create_lvdt_channels`.
+
+    See `SystemConfig` for the remaining attributes.
     """
-    def __init__(
-        self,
-        enable_lvdt=True,
-        enable_accel=True,
-        output_dir=None,
-        num_lvdts=2,
-        num_accelerometers=2,
-        lvdt_slopes=None,  # Add the lvdt_slopes parameter here
-        sampling_rate_acceleration=100.0,
-        sampling_rate_lvdt=5.0,
-        plot_refresh_rate=10.0,
-        gpio_pins=None,
-        trigger_acceleration_threshold=None,
-        detrigger_acceleration_threshold=None,
-        trigger_displacement_threshold=None,
-        detrigger_displacement_threshold=None,
-        pre_event_time=5.0,
-        post_event_time=15.0,
-        min_event_duration=2.0,
-        verbose=False,  # Add verbosity flag
-        enable_plots=True,
-        enable_plot_displacement=True,
-        enable_accel_plots=True,
-        enable_fft_plots=True,
-    ):
+    __slots__ = ("verbose", "lvdt_slope", "lvdt_intercept", "_lvdt_bank")
+
+    def __init__(self, *args, verbose=False, **kwargs):
         """Initializes the simulation configuration.
 
         Args:
-            enable_lvdt (bool): Enable LVDT simulation.
-            enable_accel (bool): Enable accelerometer simulation.
-            output_dir (str, optional): Base directory for output. Defaults to
-                'repository/<YYYYMMDD>'.
-            num_lvdts (int): Number of simulated LVDTs.
-            num_accelerometers (int): Number of simulated accelerometers.
-            lvdt_slopes (list, optional): List of slopes (mm/V) for LVDT calibration.
-            sampling_rate_acceleration (float): Target accel sampling rate (Hz).
-            sampling_rate_lvdt (float): Target LVDT sampling rate (Hz).
-            plot_refresh_rate (float): Target plot refresh rate (Hz).
-            gpio_pins (list, optional): Simulated GPIO pins for LEDs. Defaults to None.
-            trigger_acceleration_threshold (float, optional): Event trigger threshold (m/s²).
-            detrigger_acceleration_threshold (float, optional): Event detrigger threshold (m/s²).
-            trigger_displacement_threshold (float, optional): Event trigger threshold (mm).
-            detrigger_displacement_threshold (float, optional): Event detrigger threshold (mm).
-            pre_event_time (float): Pre-event buffer duration (s).
-            post_event_time (float): Post-event buffer duration (s).
-            min_event_duration (float): Minimum valid event duration (s).
+            *args: Positional arguments forwarded to `SystemConfig`.
             verbose (bool): Enable verbose output (currently unused).
-            enable_plots (bool): Enable plotting dashboard.
-            enable_plot_displacement (bool): Enable LVDT plot tab.
-            enable_accel_plots (bool): Enable Accelerometer plot tab.
-            enable_fft_plots (bool): Enable FFT plot tab.
+            **kwargs: Keyword arguments forwarded to `SystemConfig`.
         """
+        super().__init__(*args, **kwargs)
         self.verbose = verbose  # Store verbosity setting
-        self.enable_plots = enable_plots
-        self.enable_plot_displacement = enable_plot_displacement
-        self.enable_accel_plots = enable_accel_plots
-        self.enable_fft_plots = enable_fft_plots
-        # Directory and file configuration
-        self.output_dir = output_dir or os.path.join("repository", datetime.now().strftime("%Y%m%d"))
-        os.makedirs(self.output_dir, exist_ok=True)
-        self.events_dir = os.path.join(self.output_dir, "events")
-        self.logs_dir = os.path.join(self.output_dir, "logs")
-        self.reports_dir = os.path.join(self.output_dir, "reports")
-        for directory in [self.events_dir, self.logs_dir, self.reports_dir]:
-            os.makedirs(directory, exist_ok=True)
-        self.acceleration_file = os.path.join(self.output_dir, "acceleration.csv")
-        self.displacement_file = os.path.join(self.output_dir, "displacement.csv")
-        self.general_file = os.path.join(self.output_dir, "general_measurements.csv")
-        self.enable_performance_monitoring = True
-        self.performance_log_file = os.path.join(self.logs_dir, "performance_log.csv")
-        
-        # Sensor configuration
-        self.enable_lvdt = enable_lvdt
-        self.enable_accel = enable_accel
-        self.num_lvdts = num_lvdts
-        self.num_accelerometers = num_accelerometers
-        self.lvdt_slopes = lvdt_slopes # Store the lvdt_slopes
-
-        self.sampling_rate_acceleration = sampling_rate_acceleration
-        self.sampling_rate_lvdt = sampling_rate_lvdt
-        self.plot_refresh_rate = plot_refresh_rate
-        self.time_step_acceleration = 1.0 / self.sampling_rate_acceleration
-        self.time_step_lvdt = 1.0 / self.sampling_rate_lvdt
-        self.time_step_plot_refresh = 1.0 / self.plot_refresh_rate
-        
-        self.window_duration = 5
-        self.gravity = 9.81
-        self.max_accel_jitter = 1.5
-        self.max_lvdt_jitter = 5.0
-        
-        self.trigger_acceleration_threshold = trigger_acceleration_threshold or (0.3 * self.gravity)
-        self.trigger_displacement_threshold = trigger_displacement_threshold or 1.0
-        self.detrigger_acceleration_threshold = detrigger_acceleration_threshold or (self.trigger_acceleration_threshold * 0.5)
-        self.detrigger_displacement_threshold = detrigger_displacement_threshold or (self.trigger_displacement_threshold * 0.5)
-        
-        self.pre_event_time = pre_event_time # Corrected
-        self.post_event_time = post_event_time # Corrected
-        self.min_event_duration = min_event_duration
-        
+
         # Simulation parameters for LVDT
-        self.lvdt_gain = 2.0 / 3.0
-        self.lvdt_scale_factor = 0.1875
         self.lvdt_slope = 19.86
         self.lvdt_intercept = 0.0
-        
+        self._lvdt_bank = None
+
         # Accelerometer configuration (dummy values)
         self.accel_offsets = [{"x": 0.0, "y": 0.0, "z": 0.0} for _ in range(self.num_accelerometers)]
-        
+
         # In simulation, no real GPIO pins are used
-        self.gpio_pins = gpio_pins or [None, None]
-        
+        if not kwargs.get("gpio_pins"):
+            self.gpio_pins = [None, None]
+
         # Print platform information in simulation mode
-        print(f"Platform: {platform.system()} {platform.release()}")
+        describe_platform()
         print("Running in Simulation Mode")
 
-    def initialize_thresholds(self):
-        """Initializes the dictionary of event detection thresholds.
-
-        Returns:
-            dict: A dictionary containing the configured thresholds for
-                  acceleration, displacement, pre/post event times, and minimum duration.
-                  Thresholds for disabled sensors are set to None.
-        """
-        return {
-            "acceleration": self.trigger_acceleration_threshold if self.enable_accel else None,
-            "displacement": self.trigger_displacement_threshold if self.enable_lvdt else None,
-            "pre_event_time": self.pre_event_time,
-            "post_event_time": self.post_event_time,
-            "min_event_duration": self.min_event_duration,
-        }
-
     def initialize_leds(self):
         """Simulates LED initialization (returns None).
 
@@ -418,13 +402,20 @@ class SimulatorConfig:
             ads (DummyADS): The dummy ADS instance.
 
         Returns:
-            list[DummyAnalogIn]: A list of dummy analog input channel objects.
+            list[DummyAnalogIn]: Dummy analog input channels sharing one
+                `DummyLVDTBank`.
+        """
+        self._lvdt_bank = DummyLVDTBank(self.num_lvdts)
+        return [DummyAnalogIn(ads, i, self._lvdt_bank) for i in range(self.num_lvdts)]
+
+    def refresh_lvdt_channels(self):
+        """Latches one simulated sample for all LVDT channels.
+
+        Advances the shared `DummyLVDTBank` so every channel read in the
+        current acquisition cycle refers to the same instant.
         """
-        channels = []
-        for i in range(self.num_lvdts):
-            channel = DummyAnalogIn(ads, i)
-            channels.append(channel)
-        return channels
+        if self._lvdt_bank is not None:
+            self._lvdt_bank.refresh()
 
     def create_accelerometers(self):
         """Creates dummy MPU6050 accelerometer objects.
@@ -449,32 +440,3 @@ class SimulatorConfig:
             any: The original `lvdt_data` unchanged.
         """
         return lvdt_data  # Return data directly without any logging
-
-
-# Simulated utilities (similar to configurator, but dummy)
-# Removed leds() function
-
-# Removed ads1115() function
-
-def thresholds(trigger_acceleration, trigger_displacement, pre_time, enable_accel, enable_lvdt):
-    """Initializes a dictionary of event detection thresholds.
-
-    Deprecated: Use `SimulatorConfig.initialize_thresholds()` or
-    `SystemConfig.initialize_thresholds()` instead.
-
-    Args:
-        trigger_acceleration (float): Acceleration trigger threshold.
-        trigger_displacement (float): Displacement trigger threshold.
-        pre_time (float): Pre-event buffer time.
-        enable_accel (bool): Whether accelerometers are enabled.
-        enable_lvdt (bool): Whether LVDTs are enabled.
-
-    Returns:
-        dict: Dictionary containing threshold values.
-    """
-    return {
-        "acceleration": trigger_acceleration if enable_accel else None,
-        "displacement": trigger_displacement if enable_lvdt else None,
-        "pre_event_time": pre_time,
-        "post_event_time": pre_time,
-    }
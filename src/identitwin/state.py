@@ -18,6 +18,8 @@ Attributes:
     _event_lock (threading.Lock): Lock for accessing `_event_state`.
     _config_lock (threading.Lock): Lock for accessing `_config_state`.
     _system_lock (threading.Lock): Lock for accessing `_system_state`.
+    _event_changed (threading.Condition): Condition on `_event_lock`, notified
+        whenever an event state variable is set or waiters are woken.
 """
 import threading
 
@@ -32,6 +34,7 @@ _sensor_lock = threading.Lock()
 _event_lock = threading.Lock()
 _config_lock = threading.Lock()
 _system_lock = threading.Lock() # Added lock for system state
+_event_changed = threading.Condition(_event_lock)
 
 # Sensor state functions
 def set_sensor_variable(key, value):
@@ -69,6 +72,7 @@ def set_event_variable(key, value):
     """
     with _event_lock:
         _event_state[key] = value
+        _event_changed.notify_all()
 
 def get_event_variable(key, default=None):
     """Gets an event state variable in a thread-safe manner.
@@ -85,6 +89,44 @@ def get_event_variable(key, default=None):
     with _event_lock:
         return _event_state.get(key, default)
 
+def wait_event_variable_change(key, last_value, timeout=None, default=None, stop_event=None):
+    """Blocks until an event state variable differs from a known value.
+
+    Lets consumers react to changes (e.g. recording start/stop) as soon as
+    they are written instead of polling `get_event_variable`.
+
+    Args:
+        key (str): The name (key) of the event state variable.
+        last_value (any): The value the caller last observed.
+        timeout (float, optional): Maximum time to wait in seconds. Defaults
+            to None (wait indefinitely).
+        default (any, optional): The value assumed if the key is not found.
+            Defaults to None.
+        stop_event (threading.Event, optional): Also return early once this
+            event is set and `wake_event_waiters` is called. Defaults to None.
+
+    Returns:
+        any: The current value of the variable, which equals `last_value` if
+             the timeout expired or `stop_event` was set without a change.
+    """
+    def ready():
+        if stop_event is not None and stop_event.is_set():
+            return True
+        return _event_state.get(key, default) != last_value
+
+    with _event_changed:
+        _event_changed.wait_for(ready, timeout)
+        return _event_state.get(key, default)
+
+def wake_event_waiters():
+    """Wakes all threads blocked in `wait_event_variable_change`.
+
+    Waiters re-check their condition, so this only returns early those whose
+    `stop_event` has been set.
+    """
+    with _event_changed:
+        _event_changed.notify_all()
+
 # Configuration state functions
 def set_config_variable(key, value):
     """Sets a configuration state variable in a thread-safe manner.
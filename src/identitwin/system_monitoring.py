@@ -42,10 +42,14 @@ class MonitoringSystem:
         config (SystemConfig or SimulatorConfig): Configuration object holding
             system parameters and settings.
         running (bool): Flag indicating if the monitoring system is active.
+        stop_event (threading.Event): Set when monitoring stops, so waiters
+            wake up immediately instead of polling `running`.
         data_queue (deque): Queue for storing raw sensor data packets.
-        acquisition_thread (threading.Thread): Thread for acquiring data from sensors.
-        event_thread (threading.Thread): Thread for monitoring events.
-        event_monitor (EventMonitor): Instance for detecting and handling events.
+        acquisition_thread (threading.Thread or None): Thread for acquiring data from sensors.
+        event_thread (threading.Thread or None): Thread for monitoring events.
+        event_monitor (EventMonitor or None): Instance for detecting and handling events.
+        led_thread (threading.Thread or None): Thread blinking the activity LED
+            while an event is being recorded.
         event_count (int): Counter for detected events.
         sensors_initialized (bool): Flag indicating if sensors have been set up.
         last_status_time (float): Timestamp of the last status printout.
@@ -77,8 +81,12 @@ class MonitoringSystem:
         """
         self.config = config
         self.running = False
+        self.stop_event = threading.Event()
         self.data_queue = deque(maxlen=50000)
         self.acquisition_thread = None
+        self.event_thread = None
+        self.event_monitor = None
+        self.led_thread = None
         self.event_count = 0
         self.sensors_initialized = False
         self.last_status_time = 0
@@ -191,12 +199,23 @@ class MonitoringSystem:
                 self.accelerometers = self.config.create_accelerometers()
                 if self.accelerometers:
                     print("Accelerometers initialized successfully.")
-                    # Calibrate accelerometers
-                    accel_offsets = calibration.multiple_accelerometers(
-                        mpu_list=self.accelerometers,
-                        calibration_time=2.0,
-                        config=self.config
-                    )
+                    # Reuse the cached offsets when allowed, otherwise calibrate
+                    accel_offsets = None
+                    if self.config.reuse_accel_calibration:
+                        accel_offsets = calibration.load_accelerometer_offsets(
+                            self.config.accel_calibration_file, self.accelerometers
+                        )
+                        if accel_offsets:
+                            print(f"Using cached accelerometer calibration: {self.config.accel_calibration_file}")
+                    if not accel_offsets:
+                        accel_offsets = calibration.multiple_accelerometers(
+                            mpu_list=self.accelerometers,
+                            calibration_time=2.0,
+                            config=self.config
+                        )
+                        calibration.save_accelerometer_offsets(
+                            self.config.accel_calibration_file, self.accelerometers, accel_offsets
+                        )
                     if accel_offsets:
                         self.config.accel_offsets = accel_offsets
                         print("Accelerometer calibration complete.\n\n")
@@ -219,7 +238,8 @@ class MonitoringSystem:
         """Starts the data acquisition and event monitoring threads.
 
         Sets the system state to running, turns on the status LED (if available),
-        and launches the background threads for data collection and event detection.
+        and launches the background threads for data collection, event detection
+        and, if an activity LED is available, the recording indicator.
         """
         if not self.sensors_initialized:
             print("Error: Sensors are not initialized. Call setup_sensors() first.")
@@ -232,6 +252,7 @@ class MonitoringSystem:
                 print(f"Warning: Could not turn on status LED: {e}")
 
         self.running = True
+        self.stop_event.clear()
         state.set_system_variable('system_running', True) # Set global state
         self.acquisition_thread = threading.Thread(
             target=self._data_acquisition_thread, daemon=True
@@ -263,6 +284,12 @@ class MonitoringSystem:
             self.event_thread.start()
             print("Event monitoring thread started.")
 
+        if self.activity_led:
+            self.led_thread = threading.Thread(
+                target=self._activity_led_thread, daemon=True
+            )
+            self.led_thread.start()
+
     def stop_monitoring(self):
         """Stops the monitoring system and associated threads.
 
@@ -271,19 +298,15 @@ class MonitoringSystem:
         """
         print("Stopping monitoring system...")
         self.running = False
+        self.stop_event.set()
+        state.wake_event_waiters() # Release the activity LED thread
         state.set_system_variable('system_running', False) # Reset global state
 
-        if self.acquisition_thread and self.acquisition_thread.is_alive():
-            print("Waiting for acquisition thread to finish...")
-            self.acquisition_thread.join(timeout=2.0)
-
-        if (
-            hasattr(self, "event_thread")
-            and self.event_thread
-            and self.event_thread.is_alive()
-        ):
-            print("Waiting for event thread to finish...")
-            self.event_thread.join(timeout=2.0)
+        for thread, label in ((self.acquisition_thread, "acquisition"), (self.event_thread, "event"),
+                              (self.led_thread, "activity LED")):
+            if thread is not None and thread.is_alive():
+                print(f"Waiting for {label} thread to finish...")
+                thread.join(timeout=2.0)
 
         if self.status_led:
             try:
@@ -296,7 +319,7 @@ class MonitoringSystem:
             except Exception as e:
                 print(f"Warning: Could not turn off activity LED: {e}")
 
-        if hasattr(self, "event_monitor"):
+        if self.event_monitor is not None:
             self.event_count = self.event_monitor.event_count_ref[0]
 
         print("Monitoring system stopped.")
@@ -317,19 +340,46 @@ class MonitoringSystem:
         Typically interrupted by Ctrl+C, which triggers `stop_monitoring`.
         """
         try:
-            while self.running:
-                time.sleep(0.5)
+            # The timeout keeps the wait interruptible by Ctrl+C on every platform
+            while self.running and not self.stop_event.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             print("\nKeyboardInterrupt received. Stopping monitoring...")
             self.stop_monitoring()
 
+    def _activity_led_thread(self):
+        """Background thread function driving the activity/recording LED.
+
+        Sleeps until the event monitor changes `is_event_recording`, then starts
+        a background blink (0.5 s on, 0.25 s off) when an event begins and turns
+        the LED off when it ends. Only state transitions touch the hardware.
+        Returns as soon as `stop_monitoring` sets `stop_event`.
+        """
+        is_recording = False
+        while self.running and not self.stop_event.is_set():
+            current = state.wait_event_variable_change(
+                "is_event_recording", is_recording, timeout=1.0, default=False,
+                stop_event=self.stop_event
+            )
+            if current == is_recording:
+                continue  # Timed out or stopping; re-check the loop condition
+            is_recording = current
+            try:
+                if is_recording:
+                    self.activity_led.blink(on_time=0.5, off_time=0.25, background=True)
+                else:
+                    self.activity_led.off()
+            except Exception as e:
+                print(f"Warning: Could not control activity LED: {e}", file=sys.stderr)
+                return
+
     def _data_acquisition_thread(self):
         """Background thread function for continuous sensor data acquisition.
 
         Reads data from enabled LVDT and accelerometer sensors at their respective
         target sampling rates using precise timing. Enqueues the collected data
-        packet into `data_queue`. Manages the physical activity/recording LED
-        (blinking blue). Calculates and updates performance statistics periodically.
+        packet into `data_queue`. Calculates and updates performance statistics
+        periodically.
         Handles sensor communication errors and attempts recovery.
         """
         if not self.sensors_initialized:
@@ -355,35 +405,12 @@ class MonitoringSystem:
             last_accel_actual_time = None
             last_lvdt_actual_time = None
 
-            blink_cycle_duration = 0.75  # 0.5s ON + 0.25s OFF
-            blink_on_duration = 0.5
-
             while self.running:
-                now_perf = time.perf_counter() # Use perf_counter for blinking timing
+                now_perf = time.perf_counter() # Use perf_counter for sample timing
                 now_time = time.time() # Use time for general timestamps and logging checks
                 sensor_data_packet = None
                 data_acquired = False
 
-                # --- Control Physical Activity/Recording LED (Blue) ---
-                is_recording = state.get_event_variable("is_event_recording", False)
-                if self.activity_led:
-                    try:
-                        if is_recording:
-                            # Calculate phase in blink cycle
-                            time_in_cycle = now_perf % blink_cycle_duration
-                            if time_in_cycle < blink_on_duration:
-                                self.activity_led.on() # Turn ON if in the first 0.5s
-                            else:
-                                self.activity_led.off() # Turn OFF if in the last 0.25s
-                        else:
-                            self.activity_led.off() # Ensure LED is OFF if not recording
-                    except Exception as e:
-                        # Log infrequently to avoid flooding console
-                        if now_time % 10 < 0.1: # Log roughly every 10 seconds
-                             print(f"Warning: Could not control activity LED: {e}", file=sys.stderr)
-                # --- End LED Control ---
-
-
                 if self.config.enable_accel and self.accelerometers and now_perf >= next_accel_time:
                     # Add a mutex or lock for accelerometer access
                     self.accel_lock = threading.Lock()
@@ -470,6 +497,8 @@ class MonitoringSystem:
                     # Add a mutex or lock for LVDT access
                     self.lvdt_lock = threading.Lock()
                     with self.lvdt_lock:
+                        # Take one sample for all channels of this cycle
+                        self.config.refresh_lvdt_channels()
                         lvdt_data_list = []
                         for i, ch in enumerate(self.lvdt_channels):
                             try:
@@ -550,11 +579,6 @@ class MonitoringSystem:
                     elif sensor_data_packet.get('sensor_type') == 'lvdt':
                         self.display_buffer['lvdt_data'] = sensor_data_packet.get('sensor_data', {}).get('lvdt_data', [])
                         self.display_buffer['last_update'] = now
-                    if self.activity_led:
-                        try:
-                            self.activity_led.blink(on_time=0.01, off_time=0.01, n=1, background=True)
-                        except Exception:
-                            pass
 
                 if now_time - last_stats_update_time >= stats_interval:
                     self._update_performance_stats(
@@ -705,7 +729,7 @@ class MonitoringSystem:
             else:
                 print("  Data not updated in the last 500ms")
 
-        event_count = self.event_monitor.event_count_ref[0] if hasattr(self, 'event_monitor') else 0
+        event_count = self.event_monitor.event_count_ref[0] if self.event_monitor is not None else 0
         state_event_count = state.get_event_variable("event_count", 0)
 
         current_event_count = max(event_count, state_event_count)
@@ -724,7 +748,7 @@ class MonitoringSystem:
                 formatted_time = f"Recording event... ({elapsed:.1f}s elapsed)"
         print(f"Recording Status: {formatted_time}")
 
-        if hasattr(self, "event_monitor"):
+        if self.event_monitor is not None:
             avg_accel = self.event_monitor.moving_avg_accel
             avg_disp = self.event_monitor.moving_avg_disp
             detrig_accel = self.config.detrigger_acceleration_threshold